@@ -80,6 +80,7 @@ class UFHControllerDataUpdateCoordinator(
             LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=INITIALIZING_UPDATE_INTERVAL),
+            always_update=False,
         )
         self.config_entry = entry
 
@@ -301,14 +302,7 @@ class UFHControllerDataUpdateCoordinator(
 
         # Restore full PID state if available (only if not yet calculated)
         if runtime.pid.state is None and "duty_cycle" in zone_state:
-            pid_state = PIDState(
-                error=zone_state.get("error", 0.0),
-                p_term=zone_state.get("p_term", 0.0),
-                i_term=zone_state.get("i_term", 0.0),
-                d_term=zone_state.get("d_term", 0.0),
-                duty_cycle=zone_state.get("duty_cycle", 0.0),
-            )
-            runtime.pid.set_state(pid_state)
+            runtime.pid.set_state(PIDState.from_stored(zone_state))
 
         # Restore setpoint
         if "setpoint" in zone_state:
@@ -346,12 +340,13 @@ class UFHControllerDataUpdateCoordinator(
                     "enabled": runtime.state.enabled,
                 }
                 # Save full PID state if available
-                if runtime.pid.state is not None:
-                    zone_data["error"] = runtime.pid.state.error
-                    zone_data["p_term"] = runtime.pid.state.p_term
-                    zone_data["i_term"] = runtime.pid.state.i_term
-                    zone_data["d_term"] = runtime.pid.state.d_term
-                    zone_data["duty_cycle"] = runtime.pid.state.duty_cycle
+                pid_state = runtime.pid.state
+                if pid_state is not None:
+                    zone_data["error"] = pid_state.error
+                    zone_data["p_term"] = pid_state.p_term
+                    zone_data["i_term"] = pid_state.i_term
+                    zone_data["d_term"] = pid_state.d_term
+                    zone_data["duty_cycle"] = pid_state.duty_cycle
                 # Include preset_mode if set
                 if runtime.state.preset_mode is not None:
                     zone_data["preset_mode"] = runtime.state.preset_mode
@@ -1011,6 +1006,7 @@ class UFHControllerDataUpdateCoordinator(
             "controller_status": self._status.value,
             "zones_degraded": zones_degraded,
             "zones_fail_safe": zones_fail_safe,
+            "flush_enabled": self._controller.state.flush_enabled,
             "flush_request": self._controller.state.flush_request,
             "zones": {},
         }
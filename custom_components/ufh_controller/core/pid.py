@@ -5,10 +5,16 @@ This module provides a pure Python PID controller with anti-windup
 for temperature regulation in heating zones.
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PIDState:
     """
     Complete state of the PID controller.
@@ -24,6 +30,29 @@ class PIDState:
     d_term: float
     duty_cycle: float
 
+    @classmethod
+    def from_stored(cls, stored: Mapping[str, Any]) -> PIDState:
+        """
+        Build a PIDState from a persisted zone state mapping.
+
+        Missing terms default to 0.0, matching a freshly reset controller.
+
+        Args:
+            stored: Zone state mapping as written to storage.
+
+        Returns:
+            PIDState populated from the stored terms.
+
+        """
+        get = stored.get
+        return cls(
+            get("error", 0.0),
+            get("p_term", 0.0),
+            get("i_term", 0.0),
+            get("d_term", 0.0),
+            get("duty_cycle", 0.0),
+        )
+
 
 @dataclass
 class PIDController:
@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -12,16 +13,24 @@ from custom_components.ufh_controller.const import (
 )
 
 
-async def test_options_flow_show_menu(
+@pytest.fixture
+async def ready_entry(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-) -> None:
-    """Test that the options flow shows the menu."""
+) -> MockConfigEntry:
+    """Return the mock config entry after it has been set up."""
     mock_config_entry.add_to_hass(hass)
     await hass.config_entries.async_setup(mock_config_entry.entry_id)
     await hass.async_block_till_done()
+    return mock_config_entry
+
 
-    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+async def test_options_flow_show_menu(
+    hass: HomeAssistant,
+    ready_entry: MockConfigEntry,
+) -> None:
+    """Test that the options flow shows the menu."""
+    result = await hass.config_entries.options.async_init(ready_entry.entry_id)
 
     assert result["type"] is FlowResultType.MENU
     assert result["step_id"] == "init"
@@ -31,14 +40,10 @@ async def test_options_flow_show_menu(
 
 async def test_options_flow_control_entities_form(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    ready_entry: MockConfigEntry,
 ) -> None:
     """Test navigating to control entities form from menu."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result = await hass.config_entries.options.async_init(ready_entry.entry_id)
 
     # Select control_entities from menu
     result = await hass.config_entries.options.async_configure(
@@ -52,14 +57,10 @@ async def test_options_flow_control_entities_form(
 
 async def test_options_flow_update_control_entities(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    ready_entry: MockConfigEntry,
 ) -> None:
     """Test updating control entities via options flow."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result = await hass.config_entries.options.async_init(ready_entry.entry_id)
 
     # Navigate to control_entities
     result = await hass.config_entries.options.async_configure(
@@ -79,20 +80,16 @@ async def test_options_flow_update_control_entities(
     assert result["type"] is FlowResultType.CREATE_ENTRY
 
     # Verify the config entry data was updated
-    assert mock_config_entry.data["heat_request_entity"] == "switch.heat_request"
-    assert mock_config_entry.data["summer_mode_entity"] == "select.boiler_mode"
+    assert ready_entry.data["heat_request_entity"] == "switch.heat_request"
+    assert ready_entry.data["summer_mode_entity"] == "select.boiler_mode"
 
 
 async def test_options_flow_timing_form(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    ready_entry: MockConfigEntry,
 ) -> None:
     """Test navigating to timing form from menu."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result = await hass.config_entries.options.async_init(ready_entry.entry_id)
 
     # Select timing from menu
     result = await hass.config_entries.options.async_configure(
@@ -106,14 +103,10 @@ async def test_options_flow_timing_form(
 
 async def test_options_flow_update_timing(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    ready_entry: MockConfigEntry,
 ) -> None:
     """Test updating timing settings via options flow."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result = await hass.config_entries.options.async_init(ready_entry.entry_id)
 
     # Navigate to timing
     result = await hass.config_entries.options.async_configure(
@@ -137,7 +130,7 @@ async def test_options_flow_update_timing(
     assert result["type"] is FlowResultType.CREATE_ENTRY
 
     # Verify the controller subentry was updated
-    for subentry in mock_config_entry.subentries.values():
+    for subentry in ready_entry.subentries.values():
         if subentry.subentry_type == SUBENTRY_TYPE_CONTROLLER:
             timing = subentry.data.get("timing", {})
             assert timing.get("observation_period") == 3600
@@ -3,6 +3,7 @@
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.ufh_controller.const import (
     DEFAULT_TIMING,
@@ -77,16 +78,9 @@ async def test_user_flow_duplicate_aborts(
     mock_setup_entry: None,
 ) -> None:
     """Test that duplicate controller_id aborts the flow."""
-    # Create first entry
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
-    await hass.config_entries.flow.async_configure(
-        result["flow_id"],
-        user_input={"name": "My Controller"},
-    )
+    MockConfigEntry(domain=DOMAIN, unique_id="my-controller").add_to_hass(hass)
 
-    # Try to create second entry with same name (same slugified ID)
+    # Try to create an entry whose name slugifies to the existing ID
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
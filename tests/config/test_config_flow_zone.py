@@ -1,8 +1,12 @@
 """Tests for Underfloor Heating Controller zone subentry flow and helpers."""
 
+from collections.abc import Callable
 from typing import Any
 
+import pytest
+import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.config_entries import ConfigSubentry, SubentryFlowResult
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -29,17 +33,43 @@ from custom_components.ufh_controller.const import (
 # =============================================================================
 
 
-async def test_zone_subentry_user_show_form(
+async def _reconfigure_flow_at_step(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    zone_subentry: ConfigSubentry,
+    step: str,
+) -> SubentryFlowResult:
+    """Start a zone reconfigure flow and select a step from its menu."""
+    result = await hass.config_entries.subentries.async_init(
+        (entry.entry_id, SUBENTRY_TYPE_ZONE),
+        context={
+            "source": config_entries.SOURCE_RECONFIGURE,
+            "subentry_id": zone_subentry.subentry_id,
+        },
+    )
+    return await hass.config_entries.subentries.async_configure(
+        result["flow_id"],
+        user_input={"next_step_id": step},
+    )
+
+
+@pytest.fixture
+def registered_entry(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-) -> None:
-    """Test that zone add flow shows the form."""
+) -> MockConfigEntry:
+    """Return the mock config entry registered with hass, but not set up."""
     mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
+    return mock_config_entry
 
+
+async def test_zone_subentry_user_show_form(
+    hass: HomeAssistant,
+    registered_entry: MockConfigEntry,
+) -> None:
+    """Test that zone add flow shows the form."""
     result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
+        (registered_entry.entry_id, SUBENTRY_TYPE_ZONE),
         context={"source": config_entries.SOURCE_USER},
     )
 
@@ -53,8 +83,6 @@ async def test_zone_subentry_user_create_zone(
 ) -> None:
     """Test creating a zone with valid data."""
     mock_config_entry_no_zones.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry_no_zones.entry_id)
-    await hass.async_block_till_done()
 
     result = await hass.config_entries.subentries.async_init(
         (mock_config_entry_no_zones.entry_id, SUBENTRY_TYPE_ZONE),
@@ -84,8 +112,6 @@ async def test_zone_subentry_user_create_zone_with_options(
 ) -> None:
     """Test creating a zone with all optional fields."""
     mock_config_entry_no_zones.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry_no_zones.entry_id)
-    await hass.async_block_till_done()
 
     result = await hass.config_entries.subentries.async_init(
         (mock_config_entry_no_zones.entry_id, SUBENTRY_TYPE_ZONE),
@@ -122,17 +148,13 @@ async def test_zone_subentry_user_create_zone_with_options(
 
 async def test_zone_subentry_user_duplicate_error(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    registered_entry: MockConfigEntry,
 ) -> None:
     """Test that duplicate zone_id shows error."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # The mock_config_entry already has a zone with id "zone1"
+    # The registered_entry already has a zone with id "zone1"
     # Try to create another zone with the same name pattern
     result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
+        (registered_entry.entry_id, SUBENTRY_TYPE_ZONE),
         context={"source": config_entries.SOURCE_USER},
     )
 
@@ -152,24 +174,12 @@ async def test_zone_subentry_user_duplicate_error(
 
 async def test_zone_subentry_reconfigure_show_menu(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    registered_entry: MockConfigEntry,
+    zone_subentry: ConfigSubentry,
 ) -> None:
     """Test that reconfigure flow shows menu with configuration options."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
-
     result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
+        (registered_entry.entry_id, SUBENTRY_TYPE_ZONE),
         context={
             "source": config_entries.SOURCE_RECONFIGURE,
             "subentry_id": zone_subentry.subentry_id,
@@ -183,73 +193,32 @@ async def test_zone_subentry_reconfigure_show_menu(
     assert "presets" in result["menu_options"]
 
 
-async def test_zone_subentry_zone_entities_form(
+@pytest.mark.parametrize("step", ["zone_entities", "temperature_control", "presets"])
+async def test_zone_subentry_menu_navigation(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    registered_entry: MockConfigEntry,
+    zone_subentry: ConfigSubentry,
+    step: str,
 ) -> None:
-    """Test navigating to zone entities form from menu."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
-
-    result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
-        context={
-            "source": config_entries.SOURCE_RECONFIGURE,
-            "subentry_id": zone_subentry.subentry_id,
-        },
-    )
-
-    # Select zone_entities from menu
-    result = await hass.config_entries.subentries.async_configure(
-        result["flow_id"],
-        user_input={"next_step_id": "zone_entities"},
+    """Test navigating to each configuration form from the reconfigure menu."""
+    result = await _reconfigure_flow_at_step(
+        hass, registered_entry, zone_subentry, step
     )
 
     assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "zone_entities"
+    assert result["step_id"] == step
 
 
 async def test_zone_subentry_update_zone_entities(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    registered_entry: MockConfigEntry,
+    zone_subentry: ConfigSubentry,
 ) -> None:
     """Test updating zone entities while preserving other data."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
     original_zone_id = zone_subentry.data["id"]
 
-    result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
-        context={
-            "source": config_entries.SOURCE_RECONFIGURE,
-            "subentry_id": zone_subentry.subentry_id,
-        },
-    )
-
-    # Navigate to zone_entities
-    result = await hass.config_entries.subentries.async_configure(
-        result["flow_id"],
-        user_input={"next_step_id": "zone_entities"},
+    result = await _reconfigure_flow_at_step(
+        hass, registered_entry, zone_subentry, "zone_entities"
     )
 
     # Update zone entities
@@ -268,7 +237,7 @@ async def test_zone_subentry_update_zone_entities(
     assert result["reason"] == "reconfigure_successful"
 
     # Verify the subentry was updated
-    updated_subentry = mock_config_entry.subentries.get(zone_subentry.subentry_id)
+    updated_subentry = registered_entry.subentries.get(zone_subentry.subentry_id)
     assert updated_subentry is not None
     assert updated_subentry.data["id"] == original_zone_id  # ID preserved
     assert updated_subentry.data["name"] == "Updated Zone Name"
@@ -278,72 +247,14 @@ async def test_zone_subentry_update_zone_entities(
     assert updated_subentry.data["window_sensors"] == ["binary_sensor.new_window"]
 
 
-async def test_zone_subentry_temperature_control_form(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-) -> None:
-    """Test navigating to temperature control form from menu."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
-
-    result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
-        context={
-            "source": config_entries.SOURCE_RECONFIGURE,
-            "subentry_id": zone_subentry.subentry_id,
-        },
-    )
-
-    # Select temperature_control from menu
-    result = await hass.config_entries.subentries.async_configure(
-        result["flow_id"],
-        user_input={"next_step_id": "temperature_control"},
-    )
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "temperature_control"
-
-
 async def test_zone_subentry_update_temperature_control(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    registered_entry: MockConfigEntry,
+    zone_subentry: ConfigSubentry,
 ) -> None:
     """Test updating temperature control settings."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
-
-    result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
-        context={
-            "source": config_entries.SOURCE_RECONFIGURE,
-            "subentry_id": zone_subentry.subentry_id,
-        },
-    )
-
-    # Navigate to temperature_control
-    result = await hass.config_entries.subentries.async_configure(
-        result["flow_id"],
-        user_input={"next_step_id": "temperature_control"},
+    result = await _reconfigure_flow_at_step(
+        hass, registered_entry, zone_subentry, "temperature_control"
     )
 
     # Update temperature control
@@ -363,7 +274,7 @@ async def test_zone_subentry_update_temperature_control(
     assert result["reason"] == "reconfigure_successful"
 
     # Verify the subentry was updated
-    updated_subentry = mock_config_entry.subentries.get(zone_subentry.subentry_id)
+    updated_subentry = registered_entry.subentries.get(zone_subentry.subentry_id)
     assert updated_subentry is not None
     assert updated_subentry.data["setpoint"]["min"] == 17.0
     assert updated_subentry.data["setpoint"]["max"] == 27.0
@@ -373,72 +284,14 @@ async def test_zone_subentry_update_temperature_control(
     assert updated_subentry.data["pid"]["kd"] == 0.1
 
 
-async def test_zone_subentry_presets_form(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-) -> None:
-    """Test navigating to presets form from menu."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
-
-    result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
-        context={
-            "source": config_entries.SOURCE_RECONFIGURE,
-            "subentry_id": zone_subentry.subentry_id,
-        },
-    )
-
-    # Select presets from menu
-    result = await hass.config_entries.subentries.async_configure(
-        result["flow_id"],
-        user_input={"next_step_id": "presets"},
-    )
-
-    assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "presets"
-
-
 async def test_zone_subentry_update_presets(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    registered_entry: MockConfigEntry,
+    zone_subentry: ConfigSubentry,
 ) -> None:
     """Test updating zone presets."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
-
-    result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
-        context={
-            "source": config_entries.SOURCE_RECONFIGURE,
-            "subentry_id": zone_subentry.subentry_id,
-        },
-    )
-
-    # Navigate to presets
-    result = await hass.config_entries.subentries.async_configure(
-        result["flow_id"],
-        user_input={"next_step_id": "presets"},
+    result = await _reconfigure_flow_at_step(
+        hass, registered_entry, zone_subentry, "presets"
     )
 
     # Update presets
@@ -457,7 +310,7 @@ async def test_zone_subentry_update_presets(
     assert result["reason"] == "reconfigure_successful"
 
     # Verify the subentry was updated
-    updated_subentry = mock_config_entry.subentries.get(zone_subentry.subentry_id)
+    updated_subentry = registered_entry.subentries.get(zone_subentry.subentry_id)
     assert updated_subentry is not None
     assert updated_subentry.data["presets"]["home"] == 20.0
     assert updated_subentry.data["presets"]["away"] == 15.0
@@ -468,34 +321,12 @@ async def test_zone_subentry_update_presets(
 
 async def test_zone_subentry_update_presets_partial(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    registered_entry: MockConfigEntry,
+    zone_subentry: ConfigSubentry,
 ) -> None:
     """Test updating zone presets with only some presets set."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    # Get the zone subentry
-    zone_subentry = None
-    for subentry in mock_config_entry.subentries.values():
-        if subentry.subentry_type == SUBENTRY_TYPE_ZONE:
-            zone_subentry = subentry
-            break
-
-    assert zone_subentry is not None
-
-    result = await hass.config_entries.subentries.async_init(
-        (mock_config_entry.entry_id, SUBENTRY_TYPE_ZONE),
-        context={
-            "source": config_entries.SOURCE_RECONFIGURE,
-            "subentry_id": zone_subentry.subentry_id,
-        },
-    )
-
-    # Navigate to presets
-    result = await hass.config_entries.subentries.async_configure(
-        result["flow_id"],
-        user_input={"next_step_id": "presets"},
+    result = await _reconfigure_flow_at_step(
+        hass, registered_entry, zone_subentry, "presets"
     )
 
     # Update presets with only comfort and eco set
@@ -511,7 +342,7 @@ async def test_zone_subentry_update_presets_partial(
     assert result["reason"] == "reconfigure_successful"
 
     # Verify the subentry was updated - only comfort and eco should be present
-    updated_subentry = mock_config_entry.subentries.get(zone_subentry.subentry_id)
+    updated_subentry = registered_entry.subentries.get(zone_subentry.subentry_id)
     assert updated_subentry is not None
     assert updated_subentry.data["presets"] == {"comfort": 23.0, "eco": 18.0}
 
@@ -521,17 +352,76 @@ async def test_zone_subentry_update_presets_partial(
 # =============================================================================
 
 
-def test_get_timing_schema_with_defaults() -> None:
-    """Test that timing schema uses DEFAULT_TIMING when None."""
-    schema = get_timing_schema(None)
+@pytest.mark.parametrize(
+    ("get_schema", "present", "absent"),
+    [
+        (
+            get_timing_schema,
+            [
+                "observation_period",
+                "min_run_time",
+                "valve_open_time",
+                "closing_warning_duration",
+                "window_block_time",
+            ],
+            [],
+        ),
+        (
+            get_zone_schema,
+            [
+                "name",
+                "temp_sensor",
+                "valve_switch",
+                "circuit_type",
+                "window_sensors",
+                "setpoint_min",
+                "setpoint_max",
+                "setpoint_default",
+                "kp",
+                "ki",
+                "kd",
+            ],
+            [],
+        ),
+        # Entity fields only, no temperature/PID fields
+        (
+            get_zone_entities_schema,
+            ["name", "temp_sensor", "valve_switch", "circuit_type", "window_sensors"],
+            ["setpoint_min", "kp"],
+        ),
+        # Temperature/PID fields only, no entity fields
+        (
+            get_zone_temperature_schema,
+            ["setpoint_min", "setpoint_max", "setpoint_default", "kp", "ki", "kd"],
+            ["name", "temp_sensor"],
+        ),
+        (
+            get_zone_presets_schema,
+            [
+                "preset_home",
+                "preset_away",
+                "preset_eco",
+                "preset_comfort",
+                "preset_boost",
+            ],
+            [],
+        ),
+    ],
+    ids=["timing", "zone", "zone_entities", "zone_temperature", "zone_presets"],
+)
+def test_get_schema_with_defaults(
+    get_schema: Callable[[Any], vol.Schema],
+    present: list[str],
+    absent: list[str],
+) -> None:
+    """Test that schemas built from defaults contain the expected keys."""
+    schema = get_schema(None)
 
-    # Verify schema contains all expected keys
-    schema_keys = {str(key) for key in schema.schema}
-    assert "observation_period" in schema_keys
-    assert "min_run_time" in schema_keys
-    assert "valve_open_time" in schema_keys
-    assert "closing_warning_duration" in schema_keys
-    assert "window_block_time" in schema_keys
+    # Voluptuous markers compare equal to their key name
+    for key in present:
+        assert key in schema.schema
+    for key in absent:
+        assert key not in schema.schema
 
 
 def test_get_timing_schema_with_custom() -> None:
@@ -551,25 +441,6 @@ def test_get_timing_schema_with_custom() -> None:
     assert schema is not None
 
 
-def test_get_zone_schema_with_defaults() -> None:
-    """Test that zone schema uses defaults when None."""
-    schema = get_zone_schema(None)
-
-    # Verify schema contains all expected keys
-    schema_keys = {str(key) for key in schema.schema}
-    assert "name" in schema_keys
-    assert "temp_sensor" in schema_keys
-    assert "valve_switch" in schema_keys
-    assert "circuit_type" in schema_keys
-    assert "window_sensors" in schema_keys
-    assert "setpoint_min" in schema_keys
-    assert "setpoint_max" in schema_keys
-    assert "setpoint_default" in schema_keys
-    assert "kp" in schema_keys
-    assert "ki" in schema_keys
-    assert "kd" in schema_keys
-
-
 def test_get_zone_schema_with_custom() -> None:
     """Test that zone schema uses provided default values."""
     custom_defaults = {
@@ -671,76 +542,43 @@ def test_build_zone_data_with_all_values() -> None:
     assert result["pid"]["kd"] == 0.5
 
 
-def test_build_presets_from_input_all_values() -> None:
-    """Test building presets with all values provided."""
-    user_input: dict[str, Any] = {
-        "preset_home": 21.0,
-        "preset_away": 16.0,
-        "preset_eco": 19.0,
-        "preset_comfort": 22.0,
-        "preset_boost": 25.0,
-    }
-
-    result = build_presets_from_input(user_input)
-
-    assert result == {
-        "home": 21.0,
-        "away": 16.0,
-        "eco": 19.0,
-        "comfort": 22.0,
-        "boost": 25.0,
-    }
-
-
-def test_build_presets_from_input_partial() -> None:
-    """Test building presets with only some values provided."""
-    user_input: dict[str, Any] = {
-        "preset_comfort": 22.0,
-        "preset_eco": 19.0,
-    }
-
-    result = build_presets_from_input(user_input)
-
-    assert result == {"comfort": 22.0, "eco": 19.0}
-
-
-def test_build_presets_from_input_empty() -> None:
-    """Test building presets with no values provided."""
-    user_input: dict[str, Any] = {}
-
-    result = build_presets_from_input(user_input)
-
-    assert result == {}
-
-
-def test_build_presets_from_input_none_values() -> None:
-    """Test that None values are filtered out."""
-    user_input: dict[str, Any] = {
-        "preset_comfort": 22.0,
-        "preset_eco": None,
-        "preset_away": 16.0,
-        "preset_boost": None,
-    }
-
-    result = build_presets_from_input(user_input)
-
-    assert result == {"comfort": 22.0, "away": 16.0}
-
-
-def test_get_zone_entities_schema_with_defaults() -> None:
-    """Test that zone entities schema uses defaults when None."""
-    schema = get_zone_entities_schema(None)
-
-    # Verify schema contains expected keys
-    schema_keys = {str(key) for key in schema.schema}
-    assert "name" in schema_keys
-    assert "temp_sensor" in schema_keys
-    assert "valve_switch" in schema_keys
-    assert "circuit_type" in schema_keys
-    assert "window_sensors" in schema_keys
-    # Should NOT contain temperature/PID fields
-    assert "setpoint_min" not in schema_keys
-    assert "kp" not in schema_keys
+@pytest.mark.parametrize(
+    ("user_input", "expected"),
+    [
+        (
+            {
+                "preset_home": 21.0,
+                "preset_away": 16.0,
+                "preset_eco": 19.0,
+                "preset_comfort": 22.0,
+                "preset_boost": 25.0,
+            },
+            {"home": 21.0, "away": 16.0, "eco": 19.0, "comfort": 22.0, "boost": 25.0},
+        ),
+        (
+            {"preset_comfort": 22.0, "preset_eco": 19.0},
+            {"comfort": 22.0, "eco": 19.0},
+        ),
+        ({}, {}),
+        # None values are filtered out
+        (
+            {
+                "preset_comfort": 22.0,
+                "preset_eco": None,
+                "preset_away": 16.0,
+                "preset_boost": None,
+            },
+            {"comfort": 22.0, "away": 16.0},
+        ),
+    ],
+    ids=["all_values", "partial", "empty", "none_values"],
+)
+def test_build_presets_from_input(
+    user_input: dict[str, Any],
+    expected: dict[str, float],
+) -> None:
+    """Test building presets from flow input."""
+    assert build_presets_from_input(user_input) == expected
 
 
 def test_get_zone_entities_schema_with_custom() -> None:
@@ -758,23 +596,6 @@ def test_get_zone_entities_schema_with_custom() -> None:
     assert schema is not None
 
 
-def test_get_zone_temperature_schema_with_defaults() -> None:
-    """Test that zone temperature schema uses defaults when None."""
-    schema = get_zone_temperature_schema(None)
-
-    # Verify schema contains expected keys
-    schema_keys = {str(key) for key in schema.schema}
-    assert "setpoint_min" in schema_keys
-    assert "setpoint_max" in schema_keys
-    assert "setpoint_default" in schema_keys
-    assert "kp" in schema_keys
-    assert "ki" in schema_keys
-    assert "kd" in schema_keys
-    # Should NOT contain entity fields
-    assert "name" not in schema_keys
-    assert "temp_sensor" not in schema_keys
-
-
 def test_get_zone_temperature_schema_with_custom() -> None:
     """Test that zone temperature schema uses provided default values."""
     custom_defaults = {
@@ -787,19 +608,6 @@ def test_get_zone_temperature_schema_with_custom() -> None:
     assert schema is not None
 
 
-def test_get_zone_presets_schema_with_defaults() -> None:
-    """Test that zone presets schema uses default presets when None."""
-    schema = get_zone_presets_schema(None)
-
-    # Verify schema contains expected keys
-    schema_keys = {str(key) for key in schema.schema}
-    assert "preset_home" in schema_keys
-    assert "preset_away" in schema_keys
-    assert "preset_eco" in schema_keys
-    assert "preset_comfort" in schema_keys
-    assert "preset_boost" in schema_keys
-
-
 def test_get_zone_presets_schema_with_custom() -> None:
     """Test that zone presets schema uses provided preset values."""
     custom_defaults = {
@@ -1,12 +1,15 @@
 """Common fixtures for Underfloor Heating Controller tests."""
 
+import inspect
 from collections.abc import Generator
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant import block_async_io
+from homeassistant.config_entries import ConfigSubentry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers.recorder import (
     DATA_INSTANCE as RECORDER_DATA_INSTANCE,
 )
@@ -23,6 +26,9 @@ from custom_components.ufh_controller.const import (
     DOMAIN,
     SUBENTRY_TYPE_ZONE,
 )
+from custom_components.ufh_controller.coordinator import (
+    UFHControllerDataUpdateCoordinator,
+)
 
 if TYPE_CHECKING:
     from custom_components.ufh_controller.core.controller import HeatingController
@@ -282,6 +288,16 @@ def mock_config_entry_all_entities() -> MockConfigEntry:
     )
 
 
+@pytest.fixture
+def zone_subentry(mock_config_entry: MockConfigEntry) -> ConfigSubentry:
+    """Return the zone subentry of the mock config entry."""
+    return next(
+        subentry
+        for subentry in mock_config_entry.subentries.values()
+        if subentry.subentry_type == SUBENTRY_TYPE_ZONE
+    )
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(
     enable_custom_integrations: None,
@@ -289,6 +305,23 @@ def auto_enable_custom_integrations(
     """Enable custom integrations for all tests."""
 
 
+@pytest.fixture(autouse=True)
+def detect_blocking_calls(
+    request: pytest.FixtureRequest,
+    disable_block_async_io: None,
+) -> None:
+    """
+    Fail async tests that call time.sleep or block on HTTP inside the event loop.
+
+    Enables Home Assistant's loop protection, which under tests only checks
+    time.sleep, HTTPConnection.putrequest, glob and os.walk; open() and other
+    file I/O are not checked. Sync tests have no loop and are left alone.
+    disable_block_async_io restores the original functions afterwards.
+    """
+    if inspect.iscoroutinefunction(request.function):
+        block_async_io.enable()
+
+
 @pytest.fixture(autouse=True)
 def expected_lingering_timers() -> bool:
     """Allow lingering timers for coordinator updates."""
@@ -317,6 +350,86 @@ def mock_setup_entry() -> Generator[None]:
         yield
 
 
+@pytest.fixture
+def store_load() -> Generator[AsyncMock]:
+    """
+    Patch Store.async_load for the duration of a test.
+
+    Returns None (nothing stored) by default; set return_value to the payload
+    the coordinator should restore before setting up the config entry.
+    """
+    with patch(
+        "homeassistant.helpers.storage.Store.async_load",
+        return_value=None,
+    ) as mock_load:
+        yield mock_load
+
+
+@pytest.fixture
+def store_save() -> Generator[AsyncMock]:
+    """
+    Patch Store.async_save for the duration of a test.
+
+    Set side_effect to capture the payloads written by the coordinator.
+    """
+    with patch("homeassistant.helpers.storage.Store.async_save") as mock_save:
+        yield mock_save
+
+
+@pytest.fixture
+def ready_coordinator(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> UFHControllerDataUpdateCoordinator:
+    """
+    Return a coordinator subscribed to its monitored entities.
+
+    Skips config entry setup (platforms, entity registration) for tests that
+    only exercise the coordinator. Modules needing other controller entities
+    override mock_config_entry.
+    """
+    mock_config_entry.add_to_hass(hass)
+    coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
+    coordinator._async_setup_listeners()
+    return coordinator
+
+
+@pytest.fixture
+def switch_calls(hass: HomeAssistant) -> list[tuple[str, str]]:
+    """
+    Register switch.turn_on/turn_off handlers that record each call.
+
+    Each call is recorded as a (service, entity_id) tuple.
+    """
+    calls: list[tuple[str, str]] = []
+
+    async def track_switch_call(call: ServiceCall) -> None:
+        calls.append((call.service, call.data.get("entity_id", "")))
+
+    hass.services.async_register("switch", "turn_on", track_switch_call)
+    hass.services.async_register("switch", "turn_off", track_switch_call)
+    return calls
+
+
+@pytest.fixture
+def refresh_requests(
+    ready_coordinator: UFHControllerDataUpdateCoordinator,
+) -> Generator[list[None]]:
+    """
+    Record ready_coordinator.async_request_refresh calls without refreshing.
+
+    Each request appends one entry; clear the list after seeding state that
+    should not count towards the assertion.
+    """
+    requests: list[None] = []
+
+    async def record_request() -> None:
+        requests.append(None)
+
+    with patch.object(ready_coordinator, "async_request_refresh", record_request):
+        yield requests
+
+
 @pytest.fixture
 async def mock_temp_sensor(hass: HomeAssistant) -> None:
     """
@@ -1,14 +1,15 @@
 """Tests for Underfloor Heating Controller binary sensor platform."""
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ufh_controller.const import FAIL_SAFE_TIMEOUT, ZoneStatus
+from custom_components.ufh_controller.const import ZoneStatus
 
 
 @pytest.fixture
@@ -213,8 +214,10 @@ async def test_zone_binary_sensor_unavailable_during_fail_safe(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     mock_temp_sensor: None,
+    freezer: FrozenDateTimeFactory,
 ) -> None:
     """Test zone binary sensors are unavailable during FAIL_SAFE status."""
+    freezer.move_to("2026-01-14 02:00:00+00:00")
     mock_config_entry.add_to_hass(hass)
     await hass.config_entries.async_setup(mock_config_entry.entry_id)
     await hass.async_block_till_done()
@@ -226,9 +229,8 @@ async def test_zone_binary_sensor_unavailable_during_fail_safe(
     zone1 = coordinator._controller.get_zone_runtime("zone1")
     assert zone1 is not None
     zone1.state.zone_status = ZoneStatus.FAIL_SAFE
-    zone1.state.last_successful_update = datetime.now(UTC) - timedelta(
-        seconds=FAIL_SAFE_TIMEOUT + 60
-    )
+    # Last update 61 minutes ago, past the one hour fail-safe timeout
+    zone1.state.last_successful_update = datetime(2026, 1, 14, 0, 59, tzinfo=UTC)
     coordinator.async_set_updated_data(coordinator._build_state_dict())
 
     await hass.async_block_till_done()
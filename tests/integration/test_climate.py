@@ -1,5 +1,7 @@
 """Tests for Underfloor Heating Controller climate platform."""
 
+from collections.abc import Iterable
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -18,8 +20,15 @@ from homeassistant.components.climate import (
 )
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.ufh_controller.climate import UFHZoneClimate, async_setup_entry
+from custom_components.ufh_controller.coordinator import (
+    UFHControllerDataUpdateCoordinator,
+)
+from custom_components.ufh_controller.data import UFHControllerData
+
 
 @pytest.fixture
 def climate_entity_id() -> str:
@@ -28,16 +37,46 @@ def climate_entity_id() -> str:
     return "climate.test_zone_1_thermostat"
 
 
-async def test_climate_entity_created(
+@pytest.fixture
+async def setup_climate_entry(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-    climate_entity_id: str,
-) -> None:
-    """Test climate entity is created on setup."""
+    mock_temp_sensor: None,
+) -> MockConfigEntry:
+    """Return the config entry set up with the zone 1 sensors available."""
     mock_config_entry.add_to_hass(hass)
     await hass.config_entries.async_setup(mock_config_entry.entry_id)
     await hass.async_block_till_done()
+    return mock_config_entry
+
+
+@pytest.fixture
+def zone_climate(
+    ready_coordinator: UFHControllerDataUpdateCoordinator,
+    mock_config_entry: MockConfigEntry,
+) -> UFHZoneClimate:
+    """
+    Return the zone 1 climate entity built directly on a coordinator.
+
+    For tests that only read entity properties; no platform setup runs, so
+    the entity is never added to hass.
+    """
+    subentry = mock_config_entry.subentries["subentry_zone1"]
+    return UFHZoneClimate(
+        coordinator=ready_coordinator,
+        zone_id=subentry.data["id"],
+        zone_name=subentry.data["name"],
+        zone_config=dict(subentry.data),
+        subentry_id=subentry.subentry_id,
+    )
 
+
+@pytest.mark.usefixtures("setup_climate_entry")
+async def test_climate_entity_created(
+    hass: HomeAssistant,
+    climate_entity_id: str,
+) -> None:
+    """Test climate entity is created on setup."""
     state = hass.states.get(climate_entity_id)
     assert state is not None
 
@@ -58,51 +97,28 @@ async def test_climate_available_during_initializing(
 
 
 async def test_climate_default_state(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    zone_climate: UFHZoneClimate,
     mock_temp_sensor: None,
-    climate_entity_id: str,
 ) -> None:
     """Test climate entity has correct default state."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
+    await zone_climate.coordinator.async_refresh()
 
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    assert state.state == HVACMode.HEAT
+    assert zone_climate.hvac_mode == HVACMode.HEAT
 
 
-async def test_climate_hvac_modes(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
-    climate_entity_id: str,
-) -> None:
+async def test_climate_hvac_modes(zone_climate: UFHZoneClimate) -> None:
     """Test climate entity reports correct HVAC modes."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    hvac_modes = state.attributes.get("hvac_modes")
-    assert hvac_modes is not None
+    hvac_modes = zone_climate.hvac_modes
     assert HVACMode.HEAT in hvac_modes
     assert HVACMode.OFF in hvac_modes
 
 
+@pytest.mark.usefixtures("setup_climate_entry")
 async def test_climate_set_hvac_mode_off(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
     climate_entity_id: str,
 ) -> None:
     """Test setting HVAC mode to OFF."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
     await hass.services.async_call(
         CLIMATE_DOMAIN,
         SERVICE_SET_HVAC_MODE,
@@ -118,16 +134,11 @@ async def test_climate_set_hvac_mode_off(
 
 async def test_climate_set_hvac_mode_heat(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
+    setup_climate_entry: MockConfigEntry,
     climate_entity_id: str,
 ) -> None:
     """Test setting HVAC mode requests coordinator refresh."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry.runtime_data.coordinator
+    coordinator = setup_climate_entry.runtime_data.coordinator
 
     with patch.object(
         coordinator, "async_request_refresh", new_callable=AsyncMock
@@ -158,17 +169,12 @@ async def test_climate_set_hvac_mode_heat(
         mock_refresh.assert_called()
 
 
+@pytest.mark.usefixtures("setup_climate_entry")
 async def test_climate_set_temperature(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
     climate_entity_id: str,
 ) -> None:
     """Test setting target temperature."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
     await hass.services.async_call(
         CLIMATE_DOMAIN,
         SERVICE_SET_TEMPERATURE,
@@ -181,38 +187,16 @@ async def test_climate_set_temperature(
     assert state.attributes.get("temperature") == 23.0
 
 
-async def test_climate_temperature_limits(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
-    climate_entity_id: str,
-) -> None:
+async def test_climate_temperature_limits(zone_climate: UFHZoneClimate) -> None:
     """Test temperature limits are respected."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    assert state.attributes.get("min_temp") == 16.0
-    assert state.attributes.get("max_temp") == 28.0
-    assert state.attributes.get("target_temp_step") == 0.5
+    assert zone_climate.min_temp == 16.0
+    assert zone_climate.max_temp == 28.0
+    assert zone_climate.target_temperature_step == 0.5
 
 
-async def test_climate_preset_modes(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
-    climate_entity_id: str,
-) -> None:
+async def test_climate_preset_modes(zone_climate: UFHZoneClimate) -> None:
     """Test preset modes are available."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    preset_modes = state.attributes.get("preset_modes")
+    preset_modes = zone_climate.preset_modes
     assert preset_modes is not None
     assert "home" in preset_modes
     assert "away" in preset_modes
@@ -221,18 +205,25 @@ async def test_climate_preset_modes(
     assert "boost" in preset_modes
 
 
-async def test_climate_set_preset_comfort(
+@pytest.mark.parametrize(
+    ("preset_mode", "expected_setpoint"),
+    [
+        ("home", 21.0),
+        ("away", 16.0),
+        ("eco", 19.0),
+        ("comfort", 22.0),
+        ("boost", 25.0),
+    ],
+)
+async def test_climate_set_preset(
     hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
+    setup_climate_entry: MockConfigEntry,
     climate_entity_id: str,
+    preset_mode: str,
+    expected_setpoint: float,
 ) -> None:
-    """Test setting comfort preset requests coordinator refresh."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry.runtime_data.coordinator
+    """Test setting a preset applies its setpoint and requests refresh."""
+    coordinator = setup_climate_entry.runtime_data.coordinator
 
     with patch.object(
         coordinator, "async_request_refresh", new_callable=AsyncMock
@@ -240,55 +231,34 @@ async def test_climate_set_preset_comfort(
         await hass.services.async_call(
             CLIMATE_DOMAIN,
             SERVICE_SET_PRESET_MODE,
-            {ATTR_ENTITY_ID: climate_entity_id, ATTR_PRESET_MODE: "comfort"},
+            {ATTR_ENTITY_ID: climate_entity_id, ATTR_PRESET_MODE: preset_mode},
             blocking=True,
         )
 
         # Verify refresh was requested (twice: once for setpoint, once for preset_mode)
         assert mock_refresh.call_count == 2
 
+    runtime = coordinator.controller.get_zone_runtime("zone1")
+    assert runtime is not None
+    assert runtime.state.preset_mode == preset_mode
+    assert runtime.state.setpoint == expected_setpoint
 
-async def test_climate_set_preset_eco(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
-    climate_entity_id: str,
-) -> None:
-    """Test setting eco preset requests coordinator refresh."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry.runtime_data.coordinator
-
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        await hass.services.async_call(
-            CLIMATE_DOMAIN,
-            SERVICE_SET_PRESET_MODE,
-            {ATTR_ENTITY_ID: climate_entity_id, ATTR_PRESET_MODE: "eco"},
-            blocking=True,
-        )
-
-        # Verify refresh was requested (twice: once for setpoint, once for preset_mode)
-        assert mock_refresh.call_count == 2
+    # The refresh was mocked above, so run one to publish the new state
+    await coordinator.async_refresh()
+    state = hass.states.get(climate_entity_id)
+    assert state is not None
+    assert state.attributes.get(ATTR_PRESET_MODE) == preset_mode
+    assert state.attributes.get(ATTR_TEMPERATURE) == expected_setpoint
 
 
 async def test_climate_extra_attributes(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+    zone_climate: UFHZoneClimate,
     mock_temp_sensor: None,
-    climate_entity_id: str,
 ) -> None:
     """Test extra state attributes are present."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
+    await zone_climate.coordinator.async_refresh()
 
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    attrs = state.attributes
+    attrs = zone_climate.extra_state_attributes
 
     # Check extra attributes are present
     assert "duty_cycle" in attrs
@@ -328,154 +298,73 @@ async def test_climate_no_zones(
 ) -> None:
     """Test no climate entities created when no zones configured."""
     mock_config_entry_no_zones.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry_no_zones.entry_id)
-    await hass.async_block_till_done()
-
-    # No climate entities should be created
-    states = hass.states.async_entity_ids(CLIMATE_DOMAIN)
-    assert len(states) == 0
-
-
-async def test_climate_restore_setpoint_from_store(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
-    climate_entity_id: str,
-) -> None:
-    """Test climate entity restores setpoint from Store API (not RestoreEntity)."""
-    # Store API should be authoritative for setpoint, not RestoreEntity
-    stored_data = {
-        "version": 1,
-        "controller_mode": "heat",
-        "zones": {
-            "zone1": {
-                "integral": 0.0,
-                "last_error": 0.0,
-                "setpoint": 23.5,
-                "enabled": True,
-                "temperature": 20.0,
-                "display_temp": 20.0,
-            },
-        },
-    }
-
-    with patch(
-        "homeassistant.helpers.storage.Store.async_load",
-        return_value=stored_data,
-    ):
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    assert state.attributes.get(ATTR_TEMPERATURE) == 23.5
-
-
-async def test_climate_restore_hvac_mode_off_from_store(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
-    climate_entity_id: str,
-) -> None:
-    """Test climate entity restores HVAC mode OFF from Store API."""
-    stored_data = {
-        "version": 1,
-        "controller_mode": "heat",
-        "zones": {
-            "zone1": {
-                "integral": 0.0,
-                "last_error": 0.0,
-                "setpoint": 21.0,
-                "enabled": False,
-                "temperature": 20.0,
-                "display_temp": 20.0,
-            },
-        },
-    }
-
-    with patch(
-        "homeassistant.helpers.storage.Store.async_load",
-        return_value=stored_data,
-    ):
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    assert state.state == HVACMode.OFF
-
-
-async def test_climate_restore_preset_mode_from_store(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-    mock_temp_sensor: None,
-    climate_entity_id: str,
-) -> None:
-    """Test climate entity restores preset mode from Store API."""
-    stored_data = {
-        "version": 1,
-        "controller_mode": "heat",
-        "zones": {
-            "zone1": {
-                "integral": 0.0,
-                "last_error": 0.0,
-                "setpoint": 22.0,  # comfort preset temperature
-                "enabled": True,
-                "preset_mode": "comfort",
-                "temperature": 20.0,
-                "display_temp": 20.0,
-            },
-        },
-    }
-
-    with patch(
-        "homeassistant.helpers.storage.Store.async_load",
-        return_value=stored_data,
-    ):
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-    state = hass.states.get(climate_entity_id)
-    assert state is not None
-    assert state.attributes.get(ATTR_PRESET_MODE) == "comfort"
-    assert state.attributes.get(ATTR_TEMPERATURE) == 22.0
-
-
-async def test_climate_preset_cleared_when_none_stored(
+    mock_config_entry_no_zones.runtime_data = UFHControllerData(
+        coordinator=UFHControllerDataUpdateCoordinator(hass, mock_config_entry_no_zones)
+    )
+    added: list[Entity] = []
+
+    def add_entities(entities: Iterable[Entity], **_kwargs: Any) -> None:
+        added.extend(entities)
+
+    await async_setup_entry(hass, mock_config_entry_no_zones, add_entities)
+
+    assert added == []
+
+
+@pytest.mark.parametrize(
+    ("stored_zone", "expected_state", "expected_attrs"),
+    [
+        (
+            {"setpoint": 21.0, "enabled": False},
+            HVACMode.OFF,
+            {},
+        ),
+        (
+            {"setpoint": 22.0, "enabled": True, "preset_mode": "comfort"},
+            HVACMode.HEAT,
+            {ATTR_PRESET_MODE: "comfort", ATTR_TEMPERATURE: 22.0},
+        ),
+        # Store API is authoritative for setpoint, not RestoreEntity; no
+        # preset_mode key indicates a manual temperature
+        (
+            {"setpoint": 23.5, "enabled": True},
+            HVACMode.HEAT,
+            {ATTR_PRESET_MODE: None, ATTR_TEMPERATURE: 23.5},
+        ),
+    ],
+    ids=["hvac_mode_off", "preset_mode", "manual_setpoint"],
+)
+async def test_climate_restore_from_store(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     mock_temp_sensor: None,
+    store_load: AsyncMock,
     climate_entity_id: str,
+    stored_zone: dict[str, Any],
+    expected_state: HVACMode,
+    expected_attrs: dict[str, Any],
 ) -> None:
-    """Test preset mode is None when no preset stored (manual temperature)."""
-    stored_data = {
+    """Test climate entity restores zone state from the Store API."""
+    store_load.return_value = {
         "version": 1,
         "controller_mode": "heat",
         "zones": {
             "zone1": {
                 "integral": 0.0,
                 "last_error": 0.0,
-                "setpoint": 23.5,  # manual temperature, not a preset
-                "enabled": True,
                 "temperature": 20.0,
                 "display_temp": 20.0,
-                # No preset_mode key - indicates manual temperature
+                **stored_zone,
             },
         },
     }
 
-    with patch(
-        "homeassistant.helpers.storage.Store.async_load",
-        return_value=stored_data,
-    ):
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
 
     state = hass.states.get(climate_entity_id)
     assert state is not None
-    assert state.attributes.get(ATTR_PRESET_MODE) is None
-    assert state.attributes.get(ATTR_TEMPERATURE) == 23.5
+    assert state.state == expected_state
+    for attr, value in expected_attrs.items():
+        assert state.attributes.get(attr) == value
@@ -2,8 +2,9 @@
 
 import logging
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
+import pytest
 from homeassistant.core import HomeAssistant, ServiceCall
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from sqlalchemy.exc import OperationalError
@@ -63,6 +64,7 @@ class TestCoordinatorUpdateZoneFailure:
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        mock_recorder: MagicMock,
     ) -> None:
         """Test that zone stays initializing on first failure (no false alarms)."""
         mock_config_entry.add_to_hass(hass)
@@ -81,16 +83,11 @@ class TestCoordinatorUpdateZoneFailure:
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
         # Make the query fail with a SQLAlchemy error
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(
-            side_effect=OperationalError("statement", {}, Exception("DB unavailable"))
+        mock_recorder.async_add_executor_job.side_effect = OperationalError(
+            "statement", {}, Exception("DB unavailable")
         )
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         # Zone should STILL be initializing (not degraded) - no false alarm
         # before first success
@@ -100,6 +97,7 @@ class TestCoordinatorUpdateZoneFailure:
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        mock_recorder: MagicMock,
     ) -> None:
         """Test that period_state query failure sets zone to degraded after normal."""
         mock_config_entry.add_to_hass(hass)
@@ -119,16 +117,11 @@ class TestCoordinatorUpdateZoneFailure:
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
         # Make the query fail with a SQLAlchemy error
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(
-            side_effect=OperationalError("statement", {}, Exception("DB unavailable"))
+        mock_recorder.async_add_executor_job.side_effect = OperationalError(
+            "statement", {}, Exception("DB unavailable")
         )
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         # Zone should be in degraded state now
         assert runtime.state.zone_status == ZoneStatus.DEGRADED
@@ -137,6 +130,7 @@ class TestCoordinatorUpdateZoneFailure:
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        mock_recorder: MagicMock,
     ) -> None:
         """Test that open_state query failure uses fallback from current state."""
         mock_config_entry.add_to_hass(hass)
@@ -160,14 +154,9 @@ class TestCoordinatorUpdateZoneFailure:
             # Second call (open_state_avg) fails with SQLAlchemy error
             raise OperationalError("statement", {}, Exception("DB unavailable"))
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(side_effect=mock_executor)
+        mock_recorder.async_add_executor_job.side_effect = mock_executor
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         # Zone should be in normal state (non-critical failure uses fallback)
         runtime = coordinator._controller.get_zone_runtime("zone1")
@@ -182,6 +171,7 @@ class TestCoordinatorUpdateZoneFailure:
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        mock_recorder: MagicMock,
     ) -> None:
         """Test that unavailable valve state falls back to 0.0 (closed)."""
         mock_config_entry.add_to_hass(hass)
@@ -202,14 +192,9 @@ class TestCoordinatorUpdateZoneFailure:
                 return {"switch.zone1_valve": []}
             raise OperationalError("statement", {}, Exception("DB unavailable"))
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(side_effect=mock_executor)
+        mock_recorder.async_add_executor_job.side_effect = mock_executor
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         runtime = coordinator._controller.get_zone_runtime("zone1")
         assert runtime is not None
@@ -220,6 +205,7 @@ class TestCoordinatorUpdateZoneFailure:
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        mock_recorder: MagicMock,
     ) -> None:
         """Test that off valve state falls back to 0.0."""
         mock_config_entry.add_to_hass(hass)
@@ -240,14 +226,9 @@ class TestCoordinatorUpdateZoneFailure:
                 return {"switch.zone1_valve": []}
             raise OperationalError("statement", {}, Exception("DB unavailable"))
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(side_effect=mock_executor)
+        mock_recorder.async_add_executor_job.side_effect = mock_executor
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         runtime = coordinator._controller.get_zone_runtime("zone1")
         assert runtime is not None
@@ -261,21 +242,20 @@ class TestExecuteFailSafeActions:
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        switch_calls: list[tuple[str, str]],
     ) -> None:
         """Test that fail-safe mode closes all valves."""
         mock_config_entry.add_to_hass(hass)
         hass.states.async_set("sensor.zone1_temp", "20.5")
         hass.states.async_set("switch.zone1_valve", "on")
 
-        # Mock switch service
-        hass.services.async_register("switch", "turn_off", AsyncMock())
-        hass.services.async_register("switch", "turn_on", AsyncMock())
-
         coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
         # Execute fail-safe
         await coordinator._execute_fail_safe_actions()
 
+        assert ("turn_off", "switch.zone1_valve") in switch_calls
+
         # Check valve state is set to off in zone runtime
         runtime = coordinator.controller.get_zone_runtime("zone1")
         assert runtime is not None
@@ -285,10 +265,12 @@ class TestExecuteFailSafeActions:
 class TestCriticalFailureDuringUpdate:
     """Test critical failure handling during _async_update_data."""
 
+    @pytest.mark.usefixtures("switch_calls")
     async def test_degraded_zone_continues_operating(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        mock_recorder: MagicMock,
     ) -> None:
         """Test that degraded zone continues operating with fallback values."""
         mock_config_entry.add_to_hass(hass)
@@ -297,24 +279,8 @@ class TestCriticalFailureDuringUpdate:
 
         coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
-        # Track if valve service was called
-        valve_calls: list[str] = []
-
-        async def track_switch_call(call: ServiceCall) -> None:
-            valve_calls.append(call.service)
-
-        hass.services.async_register("switch", "turn_on", track_switch_call)
-        hass.services.async_register("switch", "turn_off", track_switch_call)
-
         # First, do a successful update to get zone to NORMAL
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator.async_refresh()
+        await coordinator.async_refresh()
 
         # Verify zone is now NORMAL
         zone1 = coordinator._controller.get_zone_runtime("zone1")
@@ -323,15 +289,11 @@ class TestCriticalFailureDuringUpdate:
         assert coordinator.status == ControllerStatus.NORMAL
 
         # Now make recorder query fail
-        mock_recorder.async_add_executor_job = AsyncMock(
-            side_effect=OperationalError("statement", {}, Exception("DB unavailable"))
+        mock_recorder.async_add_executor_job.side_effect = OperationalError(
+            "statement", {}, Exception("DB unavailable")
         )
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator.async_refresh()
+        await coordinator.async_refresh()
 
         # Status should be degraded
         assert coordinator.status == ControllerStatus.DEGRADED
@@ -347,6 +309,7 @@ class TestCriticalFailureDuringUpdate:
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
+        switch_calls: list[tuple[str, str]],
     ) -> None:
         """Test that zone fail-safe mode forces valve closed during update."""
         mock_config_entry.add_to_hass(hass)
@@ -364,30 +327,14 @@ class TestCriticalFailureDuringUpdate:
         # Also set zone_status to ensure it's in fail-safe
         zone1.state.zone_status = ZoneStatus.FAIL_SAFE
 
-        # Track valve service calls
-        valve_calls: list[str] = []
-
-        async def track_switch_call(call: ServiceCall) -> None:
-            valve_calls.append(call.service)
-
-        hass.services.async_register("switch", "turn_on", track_switch_call)
-        hass.services.async_register("switch", "turn_off", track_switch_call)
-
         # Make recorder succeed to allow update to complete
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator.async_refresh()
+        await coordinator.async_refresh()
 
         # Controller should be fail-safe because the single zone is in fail-safe
         assert coordinator.status == ControllerStatus.FAIL_SAFE
 
         # Zone fail-safe should have turned off the valve
-        assert "turn_off" in valve_calls
+        assert ("turn_off", "switch.zone1_valve") in switch_calls
 
 
 class TestZoneIsolation:
@@ -414,15 +361,8 @@ class TestZoneIsolation:
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
         # Make recorder succeed for both zones
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
-            await coordinator._update_zone("zone2", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone2", now, 60.0)
 
         # Zone 1 should be normal (has valid temp, first successful update)
         zone1 = coordinator._controller.get_zone_runtime("zone1")
@@ -458,14 +398,7 @@ class TestZoneIsolation:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         # Zone should be in fail-safe
         assert zone1.state.zone_status == ZoneStatus.FAIL_SAFE
@@ -496,15 +429,8 @@ class TestZoneIsolation:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
-            await coordinator._update_zone("zone2", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone2", now, 60.0)
 
         # Zone 1 should be normal
         zone1 = coordinator._controller.get_zone_runtime("zone1")
@@ -584,15 +510,8 @@ class TestZoneIsolation:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            # First update - successful, zone goes to NORMAL
-            await coordinator._update_zone("zone1", now, 60.0)
+        # First update - successful, zone goes to NORMAL
+        await coordinator._update_zone("zone1", now, 60.0)
 
         zone1 = coordinator._controller.get_zone_runtime("zone1")
         assert zone1 is not None
@@ -601,24 +520,16 @@ class TestZoneIsolation:
         # Now make temp unavailable
         hass.states.async_set("sensor.zone1_temp", "unavailable")
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            # Second update - failure, zone goes to DEGRADED
-            await coordinator._update_zone("zone1", now + timedelta(seconds=60), 60.0)
+        # Second update - failure, zone goes to DEGRADED
+        await coordinator._update_zone("zone1", now + timedelta(seconds=60), 60.0)
 
         assert zone1.state.zone_status == ZoneStatus.DEGRADED
 
         # Fix the temperature sensor
         hass.states.async_set("sensor.zone1_temp", "21.0")
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            # Third update - zone should recover to NORMAL
-            await coordinator._update_zone("zone1", now + timedelta(seconds=120), 60.0)
+        # Third update - zone should recover to NORMAL
+        await coordinator._update_zone("zone1", now + timedelta(seconds=120), 60.0)
 
         assert zone1.state.zone_status == ZoneStatus.NORMAL
 
@@ -709,14 +620,7 @@ class TestValveUnavailability:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         assert runtime.state.zone_status == ZoneStatus.DEGRADED
 
@@ -741,14 +645,7 @@ class TestValveUnavailability:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         # Valve not found maps to UNAVAILABLE via ValveState.from_ha_state(None)
         assert runtime.state.valve_state == ValveState.UNAVAILABLE
@@ -775,14 +672,7 @@ class TestValveUnavailability:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         assert runtime.state.valve_state == ValveState.UNKNOWN
         assert runtime.state.zone_status == ZoneStatus.DEGRADED
@@ -810,14 +700,7 @@ class TestValveUnavailability:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         assert runtime.state.zone_status == ZoneStatus.FAIL_SAFE
 
@@ -836,15 +719,8 @@ class TestValveUnavailability:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            # First update: successful, zone goes to NORMAL
-            await coordinator._update_zone("zone1", now, 60.0)
+        # First update: successful, zone goes to NORMAL
+        await coordinator._update_zone("zone1", now, 60.0)
 
         runtime = coordinator._controller.get_zone_runtime("zone1")
         assert runtime is not None
@@ -853,24 +729,16 @@ class TestValveUnavailability:
         # Make valve unavailable
         hass.states.async_set("switch.zone1_valve", "unavailable")
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            # Second update: valve unavailable → degraded
-            await coordinator._update_zone("zone1", now + timedelta(seconds=60), 60.0)
+        # Second update: valve unavailable → degraded
+        await coordinator._update_zone("zone1", now + timedelta(seconds=60), 60.0)
 
         assert runtime.state.zone_status == ZoneStatus.DEGRADED
 
         # Restore valve
         hass.states.async_set("switch.zone1_valve", "off")
 
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            # Third update: valve available again → recovered to NORMAL
-            await coordinator._update_zone("zone1", now + timedelta(seconds=120), 60.0)
+        # Third update: valve available again → recovered to NORMAL
+        await coordinator._update_zone("zone1", now + timedelta(seconds=120), 60.0)
 
         assert runtime.state.zone_status == ZoneStatus.NORMAL
 
@@ -894,16 +762,7 @@ class TestTempEntityNotFound:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with (
-            patch(
-                "homeassistant.components.recorder.get_instance",
-                return_value=mock_recorder,
-            ),
-            caplog.at_level(logging.WARNING),  # type: ignore[union-attr]
-        ):
+        with caplog.at_level(logging.WARNING):  # type: ignore[union-attr]
             await coordinator._update_zone("zone1", now, 60.0)
 
         assert any(
@@ -935,25 +794,14 @@ class TestInitializingTimeout:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            # First update: starts failure tracking
-            await coordinator._update_zone("zone1", now, 60.0)
+        # First update: starts failure tracking
+        await coordinator._update_zone("zone1", now, 60.0)
 
         assert zone1.state.zone_status == ZoneStatus.INITIALIZING
 
         # After INITIALIZING_TIMEOUT: should enter fail-safe
         later = now + timedelta(seconds=INITIALIZING_TIMEOUT + 1)
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", later, 60.0)
+        await coordinator._update_zone("zone1", later, 60.0)
 
         assert zone1.state.zone_status == ZoneStatus.FAIL_SAFE
 
@@ -973,23 +821,10 @@ class TestInitializingTimeout:
         now = datetime.now(UTC)
         coordinator._controller.state.observation_start = now - timedelta(hours=1)
 
-        mock_recorder = MagicMock()
-        mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-        with patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ):
-            await coordinator._update_zone("zone1", now, 60.0)
+        await coordinator._update_zone("zone1", now, 60.0)
 
         later = now + timedelta(seconds=INITIALIZING_TIMEOUT + 1)
-        with (
-            patch(
-                "homeassistant.components.recorder.get_instance",
-                return_value=mock_recorder,
-            ),
-            caplog.at_level(logging.ERROR),  # type: ignore[union-attr]
-        ):
+        with caplog.at_level(logging.ERROR):  # type: ignore[union-attr]
             await coordinator._update_zone("zone1", later, 60.0)
 
         assert any(
@@ -5,10 +5,8 @@ Verifies that the coordinator properly tracks expected states for entities it
 controls and triggers refreshes when external changes occur.
 """
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.ufh_controller.const import SummerMode
@@ -17,6 +15,18 @@ from custom_components.ufh_controller.coordinator import (
 )
 
 
+@pytest.fixture
+def mock_config_entry(
+    mock_config_entry_all_entities: MockConfigEntry,
+) -> MockConfigEntry:
+    """Monitor the controller-level entities as well as the zone valve."""
+    return mock_config_entry_all_entities
+
+
+async def _noop_service(_call: ServiceCall) -> None:
+    """Accept a service call without acting on it."""
+
+
 @pytest.mark.parametrize(
     ("entity_id", "initial_state", "new_state"),
     [
@@ -25,10 +35,11 @@ from custom_components.ufh_controller.coordinator import (
         ("select.summer_mode", "winter", "summer"),
         ("switch.zone1_valve", "off", "on"),
     ],
+    ids=["dhw_active", "heat_request", "summer_mode", "zone_valve"],
 )
 async def test_external_state_change_triggers_refresh(
     hass: HomeAssistant,
-    mock_config_entry_all_entities: MockConfigEntry,
+    refresh_requests: list[None],
     entity_id: str,
     initial_state: str,
     new_state: str,
@@ -39,22 +50,14 @@ async def test_external_state_change_triggers_refresh(
     Any state change to a monitored entity that doesn't match a coordinator-set
     expectation should trigger a refresh to pick up the new state.
     """
-    mock_config_entry_all_entities.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry_all_entities.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry_all_entities.runtime_data.coordinator
-
     hass.states.async_set(entity_id, initial_state)
     await hass.async_block_till_done()
+    refresh_requests.clear()
 
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        hass.states.async_set(entity_id, new_state)
-        await hass.async_block_till_done()
+    hass.states.async_set(entity_id, new_state)
+    await hass.async_block_till_done()
 
-        mock_refresh.assert_called_once()
+    assert len(refresh_requests) == 1
 
 
 @pytest.mark.parametrize(
@@ -63,10 +66,12 @@ async def test_external_state_change_triggers_refresh(
         ("switch.heat_request", "on"),
         ("switch.zone1_valve", "on"),
     ],
+    ids=["heat_request", "zone_valve"],
 )
 async def test_self_initiated_change_no_extra_refresh(
     hass: HomeAssistant,
-    mock_config_entry_all_entities: MockConfigEntry,
+    ready_coordinator: UFHControllerDataUpdateCoordinator,
+    refresh_requests: list[None],
     entity_id: str,
     expected_state: str,
 ) -> None:
@@ -76,49 +81,35 @@ async def test_self_initiated_change_no_extra_refresh(
     When the coordinator sets an expected state before calling a service,
     the resulting state change event should be recognized as self-initiated.
     """
-    mock_config_entry_all_entities.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry_all_entities.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry_all_entities.runtime_data.coordinator
+    coordinator = ready_coordinator
 
     hass.states.async_set(entity_id, "off")
     await hass.async_block_till_done()
+    refresh_requests.clear()
 
     # Simulate coordinator setting expected state before service call
     coordinator._expected_states[entity_id] = expected_state
 
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        hass.states.async_set(entity_id, expected_state)
-        await hass.async_block_till_done()
+    hass.states.async_set(entity_id, expected_state)
+    await hass.async_block_till_done()
 
-        mock_refresh.assert_not_called()
-        assert coordinator._expected_states.get(entity_id) is None
+    assert refresh_requests == []
+    assert coordinator._expected_states.get(entity_id) is None
 
 
 async def test_entity_removed_no_refresh(
     hass: HomeAssistant,
-    mock_config_entry_all_entities: MockConfigEntry,
+    refresh_requests: list[None],
 ) -> None:
     """Test that entity removal (new_state=None) does not trigger refresh."""
-    mock_config_entry_all_entities.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry_all_entities.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry_all_entities.runtime_data.coordinator
-
     hass.states.async_set("switch.heat_request", "off")
     await hass.async_block_till_done()
+    refresh_requests.clear()
 
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        hass.states.async_remove("switch.heat_request")
-        await hass.async_block_till_done()
+    hass.states.async_remove("switch.heat_request")
+    await hass.async_block_till_done()
 
-        mock_refresh.assert_not_called()
+    assert refresh_requests == []
 
 
 async def test_fail_safe_sets_expected_state_for_summer_mode(
@@ -136,9 +127,9 @@ async def test_fail_safe_sets_expected_state_for_summer_mode(
     hass.states.async_set("switch.zone1_valve", "on")
 
     # Register services needed by fail-safe actions
-    hass.services.async_register("switch", "turn_off", AsyncMock())
-    hass.services.async_register("switch", "turn_on", AsyncMock())
-    hass.services.async_register("select", "select_option", AsyncMock())
+    hass.services.async_register("switch", "turn_off", _noop_service)
+    hass.services.async_register("switch", "turn_on", _noop_service)
+    hass.services.async_register("select", "select_option", _noop_service)
 
     coordinator = UFHControllerDataUpdateCoordinator(
         hass, mock_config_entry_all_entities
@@ -6,89 +6,49 @@ from external entities (mode changes, setpoint adjustments, zone enable/disable,
 flush enable/disable, etc.) by requesting a refresh cycle.
 """
 
-from unittest.mock import AsyncMock, patch
+from collections.abc import Awaitable, Callable
 
-from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+import pytest
+from freezegun.api import FrozenDateTimeFactory
 
 from custom_components.ufh_controller.const import OperationMode
-
-
-async def test_mode_change_triggers_coordinator_refresh(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+from custom_components.ufh_controller.coordinator import (
+    UFHControllerDataUpdateCoordinator,
+)
+
+
+@pytest.mark.parametrize(
+    "action",
+    [
+        lambda c: c.set_mode(OperationMode.ALL_OFF),
+        lambda c: c.set_zone_setpoint("zone1", 22.0),
+        lambda c: c.set_zone_enabled("zone1", enabled=False),
+        lambda c: c.set_flush_enabled(enabled=True),
+    ],
+    ids=["mode", "setpoint", "zone_enabled", "flush_enabled"],
+)
+async def test_user_change_triggers_coordinator_refresh(
+    ready_coordinator: UFHControllerDataUpdateCoordinator,
+    refresh_requests: list[None],
+    action: Callable[[UFHControllerDataUpdateCoordinator], Awaitable[None]],
 ) -> None:
-    """Test that changing mode requests coordinator refresh."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry.runtime_data.coordinator
+    """Test that mode, setpoint, zone enable and flush changes request a refresh."""
+    await action(ready_coordinator)
 
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        await coordinator.set_mode(OperationMode.ALL_OFF)
+    assert len(refresh_requests) == 1
 
-        # Verify refresh was requested
-        mock_refresh.assert_called_once()
 
-
-async def test_setpoint_change_triggers_coordinator_refresh(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
+async def test_unchanged_refresh_does_not_notify_listeners(
+    ready_coordinator: UFHControllerDataUpdateCoordinator,
+    freezer: FrozenDateTimeFactory,
 ) -> None:
-    """Test that changing setpoint requests coordinator refresh."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry.runtime_data.coordinator
-
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        await coordinator.set_zone_setpoint("zone1", 22.0)
-
-        # Verify refresh was requested
-        mock_refresh.assert_called_once()
-
-
-async def test_zone_enable_triggers_coordinator_refresh(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-) -> None:
-    """Test that enabling/disabling zone requests coordinator refresh."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry.runtime_data.coordinator
-
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        await coordinator.set_zone_enabled("zone1", enabled=False)
-
-        # Verify refresh was requested
-        mock_refresh.assert_called_once()
-
-
-async def test_flush_enabled_triggers_coordinator_refresh(
-    hass: HomeAssistant,
-    mock_config_entry: MockConfigEntry,
-) -> None:
-    """Test that enabling/disabling flush requests coordinator refresh."""
-    mock_config_entry.add_to_hass(hass)
-    await hass.config_entries.async_setup(mock_config_entry.entry_id)
-    await hass.async_block_till_done()
-
-    coordinator = mock_config_entry.runtime_data.coordinator
+    """Test that a refresh producing identical data skips listener dispatch."""
+    # Pin time so both refreshes fall in the same observation period
+    freezer.move_to("2026-01-14 02:00:00+00:00")
+    updates: list[None] = []
+    ready_coordinator.async_add_listener(lambda: updates.append(None))
 
-    with patch.object(
-        coordinator, "async_request_refresh", new_callable=AsyncMock
-    ) as mock_refresh:
-        await coordinator.set_flush_enabled(enabled=True)
+    await ready_coordinator.async_refresh()
+    await ready_coordinator.async_refresh()
 
-        # Verify refresh was requested
-        mock_refresh.assert_called_once()
+    assert len(updates) == 1
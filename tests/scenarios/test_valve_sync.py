@@ -1,15 +1,14 @@
 """Test valve state synchronization with external changes."""
 
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from freezegun.api import FrozenDateTimeFactory
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ufh_controller.const import ValveState
+from custom_components.ufh_controller.const import LOGGER, ValveState
 from custom_components.ufh_controller.coordinator import (
     UFHControllerDataUpdateCoordinator,
 )
@@ -20,6 +19,7 @@ async def test_valve_restored_when_externally_turned_off(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     freezer: FrozenDateTimeFactory,
+    switch_calls: list[tuple[str, str]],
 ) -> None:
     """
     Test that valve is restored when something external turns it off.
@@ -38,24 +38,9 @@ async def test_valve_restored_when_externally_turned_off(
     hass.states.async_set("sensor.zone1_temp", "18.0")
     hass.states.async_set("switch.zone1_valve", "off")
 
-    switch_calls: list[tuple[str, str]] = []
-
-    async def track_switch_call(call: ServiceCall) -> None:
-        switch_calls.append((call.service, call.data.get("entity_id", "")))
-
-    hass.services.async_register("switch", "turn_on", track_switch_call)
-    hass.services.async_register("switch", "turn_off", track_switch_call)
-
     coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
-    mock_recorder = MagicMock()
-    mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
+    await coordinator.async_refresh()
 
     assert ("turn_on", "switch.zone1_valve") in switch_calls
     switch_calls.clear()
@@ -66,11 +51,7 @@ async def test_valve_restored_when_externally_turned_off(
     # Advance time slightly for second refresh
     freezer.tick(60)
 
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
+    await coordinator._async_update_data()
 
     # Valve should be restored
     assert ("turn_on", "switch.zone1_valve") in switch_calls
@@ -81,11 +62,7 @@ async def test_valve_restored_when_externally_turned_off(
 
     # Third refresh: valve ON, zone still needs heat → STAY_ON (no service call)
     freezer.tick(60)
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
+    await coordinator._async_update_data()
 
     # No service call - valve already in correct state
     assert len(switch_calls) == 0
@@ -99,6 +76,7 @@ async def test_stay_off_updates_valve_state(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     freezer: FrozenDateTimeFactory,
+    switch_calls: list[tuple[str, str]],
 ) -> None:
     """Test that STAY_OFF action updates valve_state to OFF."""
     freezer.move_to("2026-01-14 02:00:00+00:00")
@@ -108,26 +86,11 @@ async def test_stay_off_updates_valve_state(
     hass.states.async_set("sensor.zone1_temp", "25.0")
     hass.states.async_set("switch.zone1_valve", "off")
 
-    switch_calls: list[tuple[str, str]] = []
-
-    async def track_switch_call(call: ServiceCall) -> None:
-        switch_calls.append((call.service, call.data.get("entity_id", "")))
-
-    hass.services.async_register("switch", "turn_on", track_switch_call)
-    hass.services.async_register("switch", "turn_off", track_switch_call)
-
     coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
-    mock_recorder = MagicMock()
-    mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        # First refresh: valve OFF, zone doesn't need heat → STAY_OFF
-        # Force-update sends command even if state matches (dead-man-switch support)
-        await coordinator.async_refresh()
+    # First refresh: valve OFF, zone doesn't need heat → STAY_OFF
+    # Force-update sends command even if state matches (dead-man-switch support)
+    await coordinator.async_refresh()
 
     # First cycle force-update triggers service call even for STAY_OFF
     assert ("turn_off", "switch.zone1_valve") in switch_calls
@@ -135,11 +98,7 @@ async def test_stay_off_updates_valve_state(
 
     # Second refresh in same observation period - no force-update needed
     freezer.tick(60)
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
+    await coordinator._async_update_data()
 
     # No service call - valve already in correct state and force-update done
     assert len(switch_calls) == 0
@@ -157,7 +116,7 @@ async def test_stay_off_updates_valve_state(
 async def test_stay_on_resyncs_when_valve_not_on(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-    freezer: FrozenDateTimeFactory,
+    switch_calls: list[tuple[str, str]],
     initial_valve_state: ValveState,
 ) -> None:
     """
@@ -166,34 +125,12 @@ async def test_stay_on_resyncs_when_valve_not_on(
     If _execute_valve_actions_with_isolation receives STAY_ON but internal
     valve_state is not ON (uncertain or OFF), the valve should be turned on.
     """
-    freezer.move_to("2026-01-14 02:00:00+00:00")
-
     mock_config_entry.add_to_hass(hass)
     hass.states.async_set("sensor.zone1_temp", "18.0")
     hass.states.async_set("switch.zone1_valve", "off")
 
-    switch_calls: list[tuple[str, str]] = []
-
-    async def track_switch_call(call: ServiceCall) -> None:
-        switch_calls.append((call.service, call.data.get("entity_id", "")))
-
-    hass.services.async_register("switch", "turn_on", track_switch_call)
-    hass.services.async_register("switch", "turn_off", track_switch_call)
-
     coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
-    mock_recorder = MagicMock()
-    mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-    # First refresh to initialize the coordinator
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
-
-    switch_calls.clear()
-
     # Set valve_state and call _execute_valve_actions_with_isolation with STAY_ON
     runtime = coordinator._controller.get_zone_runtime("zone1")
     assert runtime is not None
@@ -204,7 +141,7 @@ async def test_stay_on_resyncs_when_valve_not_on(
     )
 
     # Service call made to sync valve state
-    assert ("turn_on", "switch.zone1_valve") in switch_calls
+    assert switch_calls == [("turn_on", "switch.zone1_valve")]
     # Verify valve_state is now tracked as ON
     assert runtime.state.valve_state == ValveState.ON
 
@@ -217,7 +154,7 @@ async def test_stay_on_resyncs_when_valve_not_on(
 async def test_stay_off_resyncs_when_valve_not_off(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-    freezer: FrozenDateTimeFactory,
+    switch_calls: list[tuple[str, str]],
     initial_valve_state: ValveState,
 ) -> None:
     """
@@ -226,34 +163,12 @@ async def test_stay_off_resyncs_when_valve_not_off(
     If _execute_valve_actions_with_isolation receives STAY_OFF but internal
     valve_state is not OFF (uncertain or ON), the valve should be turned off.
     """
-    freezer.move_to("2026-01-14 02:00:00+00:00")
-
     mock_config_entry.add_to_hass(hass)
     hass.states.async_set("sensor.zone1_temp", "25.0")
     hass.states.async_set("switch.zone1_valve", "on")
 
-    switch_calls: list[tuple[str, str]] = []
-
-    async def track_switch_call(call: ServiceCall) -> None:
-        switch_calls.append((call.service, call.data.get("entity_id", "")))
-
-    hass.services.async_register("switch", "turn_on", track_switch_call)
-    hass.services.async_register("switch", "turn_off", track_switch_call)
-
     coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
-    mock_recorder = MagicMock()
-    mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-    # First refresh to initialize the coordinator
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
-
-    switch_calls.clear()
-
     # Set valve_state and call _execute_valve_actions_with_isolation with STAY_OFF
     runtime = coordinator._controller.get_zone_runtime("zone1")
     assert runtime is not None
@@ -264,16 +179,51 @@ async def test_stay_off_resyncs_when_valve_not_off(
     )
 
     # Service call made to sync valve state
-    assert ("turn_off", "switch.zone1_valve") in switch_calls
+    assert switch_calls == [("turn_off", "switch.zone1_valve")]
     # Verify valve_state is now tracked as OFF
     assert runtime.state.valve_state == ValveState.OFF
 
 
+@pytest.mark.parametrize(
+    ("action", "initial_valve_state", "expected_call", "expected_valve_state"),
+    [
+        (ZoneAction.TURN_ON, ValveState.OFF, "turn_on", ValveState.ON),
+        (ZoneAction.TURN_OFF, ValveState.ON, "turn_off", ValveState.OFF),
+    ],
+    ids=["turn_on", "turn_off"],
+)
+async def test_turn_action_switches_valve(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    switch_calls: list[tuple[str, str]],
+    action: ZoneAction,
+    initial_valve_state: ValveState,
+    expected_call: str,
+    expected_valve_state: ValveState,
+) -> None:
+    """Test TURN_ON/TURN_OFF call the valve service and update valve_state."""
+    mock_config_entry.add_to_hass(hass)
+    hass.states.async_set("sensor.zone1_temp", "20.0")
+    hass.states.async_set("switch.zone1_valve", initial_valve_state.value)
+
+    coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
+
+    runtime = coordinator._controller.get_zone_runtime("zone1")
+    assert runtime is not None
+    runtime.state.valve_state = initial_valve_state
+
+    await coordinator._execute_valve_actions_with_isolation({"zone1": action})
+
+    assert switch_calls == [(expected_call, "switch.zone1_valve")]
+    assert runtime.state.valve_state == expected_valve_state
+
+
 @pytest.mark.parametrize(
     "valve_state",
     [STATE_UNAVAILABLE, STATE_UNKNOWN],
     ids=["unavailable", "unknown"],
 )
+@pytest.mark.usefixtures("switch_calls")
 async def test_valve_bad_state_logs_warning(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -287,31 +237,22 @@ async def test_valve_bad_state_logs_warning(
     hass.states.async_set("sensor.zone1_temp", "18.0")
     hass.states.async_set("switch.zone1_valve", valve_state)
 
-    hass.services.async_register("switch", "turn_on", AsyncMock())
-    hass.services.async_register("switch", "turn_off", AsyncMock())
-
     coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
-    mock_recorder = MagicMock()
-    mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-    with (
-        patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ),
-        caplog.at_level(logging.WARNING),
-    ):
+    with caplog.at_level(logging.WARNING):
         await coordinator.async_refresh()
 
-    # Check for warning log about valve state (either "unavailable" or "unknown")
+    # Check for the integration's warning about the valve state
     assert any(
-        ("unavailable" in record.message.lower() or "unknown" in record.message.lower())
+        record.name == LOGGER.name
+        and record.levelno == logging.WARNING
         and "switch.zone1_valve" in record.message
+        and valve_state in record.message
         for record in caplog.records
     )
 
 
+@pytest.mark.usefixtures("switch_calls")
 async def test_valve_not_found_logs_warning(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
@@ -324,25 +265,16 @@ async def test_valve_not_found_logs_warning(
     hass.states.async_set("sensor.zone1_temp", "18.0")
     # Do NOT set valve state - entity doesn't exist
 
-    hass.services.async_register("switch", "turn_on", AsyncMock())
-    hass.services.async_register("switch", "turn_off", AsyncMock())
-
     coordinator = UFHControllerDataUpdateCoordinator(hass, mock_config_entry)
 
-    mock_recorder = MagicMock()
-    mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-    with (
-        patch(
-            "homeassistant.components.recorder.get_instance",
-            return_value=mock_recorder,
-        ),
-        caplog.at_level(logging.WARNING),
-    ):
+    with caplog.at_level(logging.WARNING):
         await coordinator.async_refresh()
 
     assert any(
-        "not found" in record.message.lower() and "switch.zone1_valve" in record.message
+        record.name == LOGGER.name
+        and record.levelno == logging.WARNING
+        and "switch.zone1_valve" in record.message
+        and "not found" in record.message
         for record in caplog.records
     )
 
@@ -351,6 +283,7 @@ async def test_force_update_sends_heat_request_even_when_matching(
     hass: HomeAssistant,
     mock_config_entry_with_heat_request: MockConfigEntry,
     freezer: FrozenDateTimeFactory,
+    switch_calls: list[tuple[str, str]],
 ) -> None:
     """Test that force-update sends heat_request command even if state matches."""
     freezer.move_to("2026-01-14 02:00:00+00:00")
@@ -362,27 +295,12 @@ async def test_force_update_sends_heat_request_even_when_matching(
     # Heat request already off - matches expected state
     hass.states.async_set("switch.heat_request", "off")
 
-    switch_calls: list[tuple[str, str]] = []
-
-    async def track_switch_call(call: ServiceCall) -> None:
-        switch_calls.append((call.service, call.data.get("entity_id", "")))
-
-    hass.services.async_register("switch", "turn_on", track_switch_call)
-    hass.services.async_register("switch", "turn_off", track_switch_call)
-
     coordinator = UFHControllerDataUpdateCoordinator(
         hass, mock_config_entry_with_heat_request
     )
 
-    mock_recorder = MagicMock()
-    mock_recorder.async_add_executor_job = AsyncMock(return_value={})
-
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        # First refresh: force-update sends command even though state matches
-        await coordinator.async_refresh()
+    # First refresh: force-update sends command even though state matches
+    await coordinator.async_refresh()
 
     # First cycle force-update triggers service call for heat_request
     # (turn_off because zone doesn't need heat)
@@ -391,11 +309,7 @@ async def test_force_update_sends_heat_request_even_when_matching(
 
     # Second refresh in same observation period - no force-update
     freezer.tick(60)
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
+    await coordinator._async_update_data()
 
     # No heat_request call - state matches and force-update already done
     assert ("turn_off", "switch.heat_request") not in switch_calls
@@ -405,11 +319,7 @@ async def test_force_update_sends_heat_request_even_when_matching(
     # Simulate external system turning heat_request on
     hass.states.async_set("switch.heat_request", "on")
     freezer.tick(60)
-    with patch(
-        "homeassistant.components.recorder.get_instance",
-        return_value=mock_recorder,
-    ):
-        await coordinator.async_refresh()
+    await coordinator._async_update_data()
 
     # Service call made because state doesn't match (force_update=False but mismatch)
     assert ("turn_off", "switch.heat_request") in switch_calls
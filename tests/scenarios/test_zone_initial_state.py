@@ -40,9 +40,9 @@ class TestZoneStateInitialization:
 class TestControllerZoneInitialization:
     """Test that HeatingController initializes zones with None PID values."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def basic_config(self) -> ControllerConfig:
-        """Create a basic controller configuration."""
+        """Create a basic controller configuration (not mutated by the tests)."""
         return ControllerConfig(
             controller_id="heating",
             name="Heating Controller",
@@ -56,12 +56,15 @@ class TestControllerZoneInitialization:
             ],
         )
 
+    @pytest.fixture
+    def controller(self, basic_config: ControllerConfig) -> HeatingController:
+        """Create a fresh controller for each test."""
+        return HeatingController(basic_config)
+
     def test_controller_zone_pid_fields_start_as_none(
-        self, basic_config: ControllerConfig
+        self, controller: HeatingController
     ) -> None:
         """Test zone PID state is None before first PID update."""
-        controller = HeatingController(basic_config)
-
         runtime = controller.get_zone_runtime("living_room")
         assert runtime is not None
 
@@ -69,10 +72,9 @@ class TestControllerZoneInitialization:
         assert runtime.pid.state is None, "PID state should be None before first update"
 
     def test_controller_zone_pid_fields_have_values_after_update(
-        self, basic_config: ControllerConfig
+        self, controller: HeatingController
     ) -> None:
         """Test zone PID fields have float values after PID update."""
-        controller = HeatingController(basic_config)
         controller.set_zone_setpoint("living_room", 22.0)
 
         # Perform a PID update with a valid temperature
@@ -108,83 +110,27 @@ class TestSensorInitialValues:
     from recording null values to history during restarts.
     """
 
-    async def test_duty_cycle_sensor_unavailable_before_calculation(
+    async def test_zone_sensors_unavailable_before_calculation(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
     ) -> None:
-        """Test duty cycle sensor is unavailable before first PID calculation."""
+        """Test duty cycle and PID sensors are unavailable before first calculation."""
         mock_config_entry.add_to_hass(hass)
         await hass.config_entries.async_setup(mock_config_entry.entry_id)
         await hass.async_block_till_done()
 
-        state = hass.states.get("sensor.test_zone_1_duty_cycle")
-        assert state is not None
-        # Sensor should be unavailable (not unknown) to prevent history recording
-        assert state.state == STATE_UNAVAILABLE, (
-            f"Sensor should be unavailable before PID calculation, got {state.state}"
-        )
-
-    async def test_pid_error_sensor_unavailable_before_calculation(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-    ) -> None:
-        """Test PID error sensor is unavailable before first PID calculation."""
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        state = hass.states.get("sensor.test_zone_1_pid_error")
-        assert state is not None
-        assert state.state == STATE_UNAVAILABLE, (
-            f"Sensor should be unavailable before PID calculation, got {state.state}"
-        )
-
-    async def test_pid_proportional_sensor_unavailable_before_calculation(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-    ) -> None:
-        """Test PID proportional sensor is unavailable before first PID calculation."""
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        state = hass.states.get("sensor.test_zone_1_pid_proportional")
-        assert state is not None
-        assert state.state == STATE_UNAVAILABLE, (
-            f"Sensor should be unavailable before PID calculation, got {state.state}"
-        )
-
-    async def test_pid_integral_sensor_unavailable_before_calculation(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-    ) -> None:
-        """Test PID integral sensor is unavailable before first PID calculation."""
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        state = hass.states.get("sensor.test_zone_1_pid_integral")
-        assert state is not None
-        assert state.state == STATE_UNAVAILABLE, (
-            f"Sensor should be unavailable before PID calculation, got {state.state}"
-        )
-
-    async def test_pid_derivative_sensor_unavailable_before_calculation(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-    ) -> None:
-        """Test PID derivative sensor is unavailable before first PID calculation."""
-        mock_config_entry.add_to_hass(hass)
-        await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
-
-        state = hass.states.get("sensor.test_zone_1_pid_derivative")
-        assert state is not None
-        assert state.state == STATE_UNAVAILABLE, (
-            f"Sensor should be unavailable before PID calculation, got {state.state}"
-        )
+        for sensor in (
+            "duty_cycle",
+            "pid_error",
+            "pid_proportional",
+            "pid_integral",
+            "pid_derivative",
+        ):
+            state = hass.states.get(f"sensor.test_zone_1_{sensor}")
+            assert state is not None, f"sensor.test_zone_1_{sensor} not found"
+            # Sensor should be unavailable (not unknown) to prevent history recording
+            assert state.state == STATE_UNAVAILABLE, (
+                f"{sensor} should be unavailable before PID calculation, "
+                f"got {state.state}"
+            )
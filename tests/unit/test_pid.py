@@ -284,3 +284,26 @@ class TestPIDState:
             error=1.0, p_term=50.0, i_term=10.0, d_term=0.0, duty_cycle=60.0
         )
         assert state1 == state2
+
+    def test_from_stored(self) -> None:
+        """Test PIDState built from a stored zone state mapping."""
+        state = PIDState.from_stored(
+            {
+                "error": 1.5,
+                "p_term": 25.0,
+                "i_term": 75.0,
+                "d_term": 0.8,
+                "duty_cycle": 65.0,
+                "setpoint": 22.0,
+            }
+        )
+        assert state == PIDState(
+            error=1.5, p_term=25.0, i_term=75.0, d_term=0.8, duty_cycle=65.0
+        )
+
+    def test_from_stored_missing_terms_default_to_zero(self) -> None:
+        """Test that terms missing from storage default to 0.0."""
+        state = PIDState.from_stored({"duty_cycle": 40.0})
+        assert state == PIDState(
+            error=0.0, p_term=0.0, i_term=0.0, d_term=0.0, duty_cycle=40.0
+        )